@@ -24,11 +24,18 @@ Example usage:
     )
 """
 
+import codecs
+from collections import defaultdict
+from functools import lru_cache
+from html import unescape
 from typing import Dict, List, Optional, Any
 from urllib.parse import urlparse
 
 try:
     from autoscraper import AutoScraper
+    from autoscraper.utils import normalize, unique_hashable, unique_stack_list
+    from bs4 import BeautifulSoup
+    from bs4.dammit import EncodingDetector
 except ImportError:
     raise ImportError(
         "autoscraper is required for this module. "
@@ -37,6 +44,26 @@ except ImportError:
 
 from .requests_adapter import ProxySession
 
+# BeautifulSoup tree builder used for every parsed page (same as AutoScraper)
+_PARSER = "lxml"
+
+
+@lru_cache(maxsize=1024)
+def _netloc(url: str) -> str:
+    """Return the netloc of a URL, cached for repeated fetches."""
+    return urlparse(url).netloc
+
+
+def _declared_encoding(content: bytes) -> Optional[str]:
+    """Return the charset declared in an HTML document, if Python knows it."""
+    encoding = EncodingDetector.find_declared_encoding(content, is_html=True)
+    if encoding:
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            return None  # e.g. <meta charset="bogus-enc">
+    return encoding
+
 
 class ProxyAutoScraper(AutoScraper):
     """
@@ -48,6 +75,10 @@ class ProxyAutoScraper(AutoScraper):
     Args:
         proxy_headers: Dict of headers to send to proxy servers
         stack_list: Initial stack list (rules) for the scraper
+        parse_only: Optional bs4 SoupStrainer. When set, only matching tags
+            (and their descendants) are kept while parsing, which makes
+            parsing large pages faster. Rules learned with a strainer should
+            be applied with the same strainer.
     
     Example:
         scraper = ProxyAutoScraper(proxy_headers={'X-ProxyMesh-Country': 'US'})
@@ -68,10 +99,12 @@ class ProxyAutoScraper(AutoScraper):
     def __init__(
         self,
         proxy_headers: Optional[Dict[str, str]] = None,
-        stack_list: Optional[List] = None
+        stack_list: Optional[List] = None,
+        parse_only: Optional[Any] = None,
     ):
         super().__init__(stack_list=stack_list)
         self._proxy_headers = proxy_headers or {}
+        self._parse_only = parse_only
         self._session: Optional[ProxySession] = None
     
     def _get_session(self) -> ProxySession:
@@ -129,30 +162,29 @@ class ProxyAutoScraper(AutoScraper):
         Returns:
             HTML content as string
         """
-        request_args = request_args or {}
-        
-        # Build headers
-        headers = dict(self.request_headers)
-        if url:
-            headers["Host"] = urlparse(url).netloc
+        request_args = dict(request_args or {})
         
+        # Build headers in one pass: defaults, Host, then user overrides
         user_headers = request_args.pop("headers", {})
-        headers.update(user_headers)
+        if url:
+            headers = {**self.request_headers, "Host": _netloc(url), **user_headers}
+        else:
+            headers = {**self.request_headers, **user_headers}
         
-        # Use our ProxySession
+        # Use our ProxySession. Per-call proxies are passed through to
+        # session.get() (requests merges them with session.proxies) rather
+        # than written onto the shared session.
         session = self._get_session()
         
-        # Copy session-level settings if not in request_args
-        if 'proxies' in request_args:
-            session.proxies.update(request_args.pop('proxies'))
-        
         res = session.get(url, headers=headers, **request_args)
         
-        # Handle encoding
+        # Handle encoding. Prefer the page's own <meta> charset, found by a
+        # quick scan near the start of the document, over apparent_encoding,
+        # which runs charset detection across the entire body.
         if res.encoding == "ISO-8859-1" and "ISO-8859-1" not in res.headers.get(
             "Content-Type", ""
         ):
-            res.encoding = res.apparent_encoding
+            res.encoding = _declared_encoding(res.content) or res.apparent_encoding
         
         return res.text
     
@@ -168,18 +200,15 @@ class ProxyAutoScraper(AutoScraper):
         Returns:
             BeautifulSoup object
         """
-        from html import unescape
-        from bs4 import BeautifulSoup
-        from autoscraper.utils import normalize
-        
-        if html:
-            html = normalize(unescape(html))
-            return BeautifulSoup(html, "lxml")
-        
-        html = self._fetch_html_with_proxy(url, request_args)
-        html = normalize(unescape(html))
-        
-        return BeautifulSoup(html, "lxml")
+        if not html:
+            html = self._fetch_html_with_proxy(url, request_args)
+        
+        # AutoScraper's rule matching (findAll with attrs, findParent,
+        # per-node attributes like wanted_attr) relies on the bs4 Tag API,
+        # so the tree must stay a BeautifulSoup tree built by lxml.
+        return BeautifulSoup(
+            normalize(unescape(html)), _PARSER, parse_only=self._parse_only
+        )
     
     def build(
         self,
@@ -208,9 +237,6 @@ class ProxyAutoScraper(AutoScraper):
         Returns:
             List of similar results
         """
-        from html import unescape
-        from autoscraper.utils import normalize, unique_hashable, unique_stack_list
-        
         if not wanted_list and not (wanted_dict and any(wanted_dict.values())):
             raise ValueError("No targets were supplied")
         
@@ -265,7 +291,7 @@ class ProxyAutoScraper(AutoScraper):
         
         Same as AutoScraper.get_result_similar() but uses ProxySession.
         """
-        if soup is None and url is not None:
+        if soup is None and (url is not None or html is not None):
             soup = self._get_soup_with_proxy(url=url, html=html, request_args=request_args)
         
         return super().get_result_similar(
@@ -299,7 +325,7 @@ class ProxyAutoScraper(AutoScraper):
         
         Same as AutoScraper.get_result_exact() but uses ProxySession.
         """
-        if soup is None and url is not None:
+        if soup is None and (url is not None or html is not None):
             soup = self._get_soup_with_proxy(url=url, html=html, request_args=request_args)
         
         return super().get_result_exact(
@@ -329,16 +355,57 @@ class ProxyAutoScraper(AutoScraper):
         
         Same as AutoScraper.get_result() but uses ProxySession.
         """
-        soup = self._get_soup_with_proxy(url=url, html=html, request_args=request_args)
-        
-        args = dict(
+        return self._get_results_fused(
+            soup=self._get_soup_with_proxy(url=url, html=html, request_args=request_args),
             url=url,
-            soup=soup,
             grouped=grouped,
             group_by_alias=group_by_alias,
             unique=unique,
             attr_fuzz_ratio=attr_fuzz_ratio,
         )
-        similar = self.get_result_similar(**args)
-        exact = self.get_result_exact(**args)
+    
+    def _get_results_fused(
+        self,
+        soup,
+        url: Optional[str] = None,
+        grouped: bool = False,
+        group_by_alias: bool = False,
+        unique: Optional[bool] = None,
+        attr_fuzz_ratio: float = 1.0,
+    ):
+        """
+        Get similar and exact results in a single pass over the rules.
+        
+        Equivalent to calling get_result_similar() and get_result_exact()
+        with default options, but visits each rule once for both matchers.
+        """
+        if group_by_alias:
+            for index, child in enumerate(soup.findChildren()):
+                setattr(child, "child_index", index)
+        
+        similar_list, exact_list = [], []
+        similar_grouped, exact_grouped = defaultdict(list), defaultdict(list)
+        
+        for stack in self.stack_list:
+            if not url:
+                url = stack.get("url", "")
+            
+            similar = self._get_result_with_stack(stack, soup, url, attr_fuzz_ratio)
+            exact = self._get_result_with_stack_index_based(stack, soup, url, attr_fuzz_ratio)
+            
+            if not grouped and not group_by_alias:
+                similar_list += similar
+                exact_list += exact
+                continue
+            
+            group_id = stack.get("alias", "") if group_by_alias else stack["stack_id"]
+            similar_grouped[group_id] += similar
+            exact_grouped[group_id] += exact
+        
+        similar = self._clean_result(
+            similar_list, similar_grouped, grouped, group_by_alias, unique, False
+        )
+        exact = self._clean_result(
+            exact_list, exact_grouped, grouped, group_by_alias, unique, False
+        )
         return similar, exact
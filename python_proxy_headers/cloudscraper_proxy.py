@@ -16,6 +16,7 @@ Example usage:
     print(response.proxy_headers)
 """
 
+from types import MappingProxyType
 from typing import Dict, Optional, Any
 
 try:
@@ -40,10 +41,26 @@ class CipherSuiteProxyHeaderAdapter(CipherSuiteAdapter):
     - Uses our custom ProxyManager that captures proxy response headers
     """
     
+    __slots__ = ('_proxy_headers',)
+    
     def __init__(self, proxy_headers: Optional[Dict[str, str]] = None, **kwargs):
-        self._proxy_headers = proxy_headers or {}
+        # Frozen copy, so later changes to the caller's dict don't leak into
+        # proxy managers created afterwards
+        self._proxy_headers = MappingProxyType(dict(proxy_headers or {}))
         super().__init__(**kwargs)
     
+    def set_proxy_headers(self, proxy_headers: Optional[Dict[str, str]]) -> None:
+        """
+        Replace the custom proxy headers.
+        
+        Cached proxy managers were created with the old headers, so they are
+        cleared and rebuilt lazily on the next request through each proxy.
+        """
+        self._proxy_headers = MappingProxyType(dict(proxy_headers or {}))
+        for manager in self.proxy_manager.values():
+            manager.clear()
+        self.proxy_manager.clear()
+    
     def proxy_manager_for(self, proxy, **proxy_kwargs):
         """
         Return a ProxyManager for the given proxy with custom header support.
@@ -109,64 +126,36 @@ class ProxyCloudScraper(cloudscraper.CloudScraper):
         super().__init__(**kwargs)
         
         # Replace the HTTPS adapter with our proxy-header-aware version
-        # We need to preserve the cipher suite settings from the parent
-        self.mount(
-            'https://',
-            CipherSuiteProxyHeaderAdapter(
-                proxy_headers=self._proxy_headers,
-                cipherSuite=self.cipherSuite,
-                ecdhCurve=getattr(self, 'ecdhCurve', 'prime256v1'),
-                server_hostname=getattr(self, 'server_hostname', None),
-                source_address=getattr(self, 'source_address', None),
-                ssl_context=getattr(self, 'ssl_context', None)
-            )
-        )
-        
-        # Also mount for HTTP (though proxy headers are mainly for HTTPS CONNECT)
-        self.mount(
-            'http://',
-            CipherSuiteProxyHeaderAdapter(
-                proxy_headers=self._proxy_headers,
-                cipherSuite=self.cipherSuite,
-                ecdhCurve=getattr(self, 'ecdhCurve', 'prime256v1'),
-                server_hostname=getattr(self, 'server_hostname', None),
-                source_address=getattr(self, 'source_address', None),
-                ssl_context=getattr(self, 'ssl_context', None)
-            )
+        # We need to preserve the cipher suite settings from the parent.
+        # The same adapter also serves HTTP, since plain-HTTP requests sent
+        # through a proxy carry the custom proxy headers too.
+        self._proxy_adapter = self._make_proxy_adapter()
+        self.mount('https://', self._proxy_adapter)
+        self.mount('http://', self._proxy_adapter)
+    
+    def _make_proxy_adapter(self) -> CipherSuiteProxyHeaderAdapter:
+        """Create a proxy header adapter with this scraper's cipher suite settings."""
+        return CipherSuiteProxyHeaderAdapter(
+            proxy_headers=self._proxy_headers,
+            cipherSuite=self.cipherSuite,
+            ecdhCurve=getattr(self, 'ecdhCurve', 'prime256v1'),
+            server_hostname=getattr(self, 'server_hostname', None),
+            source_address=getattr(self, 'source_address', None),
+            ssl_context=getattr(self, 'ssl_context', None)
         )
     
     def set_proxy_headers(self, proxy_headers: Dict[str, str]):
         """
-        Update the proxy headers and remount adapters.
+        Update the proxy headers on the mounted adapter.
+        
+        The adapter (and its SSL context and origin pools) is kept;
+        only the cached proxy managers are rebuilt with the new headers.
         
         Args:
             proxy_headers: New proxy headers to use
         """
         self._proxy_headers = proxy_headers
-        
-        # Remount adapters with new headers
-        self.mount(
-            'https://',
-            CipherSuiteProxyHeaderAdapter(
-                proxy_headers=self._proxy_headers,
-                cipherSuite=self.cipherSuite,
-                ecdhCurve=getattr(self, 'ecdhCurve', 'prime256v1'),
-                server_hostname=getattr(self, 'server_hostname', None),
-                source_address=getattr(self, 'source_address', None),
-                ssl_context=getattr(self, 'ssl_context', None)
-            )
-        )
-        self.mount(
-            'http://',
-            CipherSuiteProxyHeaderAdapter(
-                proxy_headers=self._proxy_headers,
-                cipherSuite=self.cipherSuite,
-                ecdhCurve=getattr(self, 'ecdhCurve', 'prime256v1'),
-                server_hostname=getattr(self, 'server_hostname', None),
-                source_address=getattr(self, 'source_address', None),
-                ssl_context=getattr(self, 'ssl_context', None)
-            )
-        )
+        self._proxy_adapter.set_proxy_headers(proxy_headers)
 
 
 def create_scraper(
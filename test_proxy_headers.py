@@ -43,21 +43,41 @@ Exit codes:
     1 - One or more tests failed
 """
 
+import atexit
 import os
 import sys
-import importlib
-import traceback
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, Optional, List, Type
-from urllib.parse import urlparse
+import threading
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Dict, Optional, List, Sequence, Tuple, Type
+
+
+# Separator lines for the banner and results summary
+_SEP = "=" * 60
+_SEP_LINE = f"\n{_SEP}"
+
+# dataclass(slots=True) needs Python 3.10+; older versions keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 # =============================================================================
 # Configuration
 # =============================================================================
 
-@dataclass
+def _read_env_snapshot() -> Tuple[Optional[str], str, str, Optional[str], Optional[str]]:
+    """Read the configuration environment variables."""
+    environ = os.environ
+    return (
+        environ.get('PROXY_URL') or environ.get('HTTPS_PROXY') or environ.get('https_proxy'),
+        environ.get('TEST_URL', 'https://httpbin.org/ip'),
+        # Interned, as it is used as a lookup key in every test
+        sys.intern(environ.get('PROXY_HEADER', 'X-ProxyMesh-IP')),
+        environ.get('SEND_PROXY_HEADER'),
+        environ.get('SEND_PROXY_VALUE'),
+    )
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TestConfig:
     """Test configuration from environment variables."""
     proxy_url: str
@@ -65,28 +85,25 @@ class TestConfig:
     proxy_header: str
     send_proxy_header: Optional[str] = None
     send_proxy_value: Optional[str] = None
+    # Dict of headers to send to proxy, if configured (built once)
+    proxy_headers_to_send: Dict[str, str] = field(init=False, repr=False, compare=False)
     
-    @property
-    def proxy_headers_to_send(self) -> Dict[str, str]:
-        """Get dict of headers to send to proxy, if configured."""
+    def __post_init__(self):
         if self.send_proxy_header and self.send_proxy_value:
-            return {self.send_proxy_header: self.send_proxy_value}
-        return {}
+            headers = {self.send_proxy_header: self.send_proxy_value}
+        else:
+            headers = {}
+        object.__setattr__(self, 'proxy_headers_to_send', headers)
     
     @classmethod
     def from_env(cls) -> 'TestConfig':
         """Load configuration from environment variables."""
-        proxy_url = os.environ.get('PROXY_URL') or os.environ.get('HTTPS_PROXY') or os.environ.get('https_proxy')
+        proxy_url, test_url, proxy_header, send_proxy_header, send_proxy_value = _read_env_snapshot()
         if not proxy_url:
             raise EnvironmentError(
                 "No proxy URL configured. Set PROXY_URL or HTTPS_PROXY environment variable."
             )
         
-        test_url = os.environ.get('TEST_URL', 'https://httpbin.org/ip')
-        proxy_header = os.environ.get('PROXY_HEADER', 'X-ProxyMesh-IP')
-        send_proxy_header = os.environ.get('SEND_PROXY_HEADER')
-        send_proxy_value = os.environ.get('SEND_PROXY_VALUE')
-        
         return cls(
             proxy_url=proxy_url,
             test_url=test_url,
@@ -100,7 +117,7 @@ class TestConfig:
 # Test Result
 # =============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TestResult:
     """Result of a single module test."""
     module_name: str
@@ -127,12 +144,37 @@ class TestResult:
 # Base Test Class
 # =============================================================================
 
-class ModuleTest(ABC):
+def _wrap_errors(test: Callable[..., TestResult]) -> Callable[..., TestResult]:
+    """Decorate a ModuleTest.test method to report exceptions as failed results."""
+    @wraps(test)
+    def wrapper(self: 'ModuleTest', config: TestConfig) -> TestResult:
+        try:
+            return test(self, config)
+        except ImportError as e:
+            return TestResult(
+                module_name=self.name,
+                success=False,
+                error=f"Import error: {e}"
+            )
+        except Exception as e:
+            return TestResult(
+                module_name=self.name,
+                success=False,
+                error=f"{type(e).__name__}: {e}"
+            )
+    return wrapper
+
+
+class ModuleTest:
     """Base class for module tests."""
     
+    # Tests keep no per-instance state
+    __slots__ = ()
+    
     name: str = "base"
+    # python_proxy_headers module the test exercises
+    extension: Optional[str] = None
     
-    @abstractmethod
     def test(self, config: TestConfig) -> TestResult:
         """
         Run the test for this module.
@@ -143,25 +185,33 @@ class ModuleTest(ABC):
         Returns:
             TestResult with success/failure and header value or error
         """
-        pass
+        raise NotImplementedError
     
-    def _check_header(self, headers: Dict[str, str], header_name: str) -> Optional[str]:
+    def _make_result(self, config: TestConfig, header_value: Optional[str], status: Optional[int]) -> TestResult:
         """
-        Check for header in response (case-insensitive).
+        Build the result for a completed request.
         
         Args:
-            headers: Response headers dict
-            header_name: Header name to look for
+            config: Test configuration
+            header_value: Value of the checked header, if found
+            status: Response status code
             
         Returns:
-            Header value if found, None otherwise
+            Passing TestResult if the header was found, failing otherwise
         """
-        # Case-insensitive header lookup
-        header_lower = header_name.lower()
-        for key, value in headers.items():
-            if key.lower() == header_lower:
-                return value
-        return None
+        if header_value:
+            return TestResult(
+                module_name=self.name,
+                success=True,
+                header_value=header_value,
+                response_status=status
+            )
+        return TestResult(
+            module_name=self.name,
+            success=False,
+            error=f"Header '{config.proxy_header}' not found in response",
+            response_status=status
+        )
 
 
 # =============================================================================
@@ -171,52 +221,29 @@ class ModuleTest(ABC):
 class Urllib3Test(ModuleTest):
     """Test for urllib3 extension."""
     
+    __slots__ = ()
+    
     name = "urllib3"
+    extension = "python_proxy_headers.urllib3_proxy_manager"
     
+    @_wrap_errors
     def test(self, config: TestConfig) -> TestResult:
-        try:
-            from python_proxy_headers.urllib3_proxy_manager import proxy_from_url
-            
-            # Create proxy manager (ProxyHeaderManager) with optional proxy headers
-            manager = proxy_from_url(
-                config.proxy_url,
-                proxy_headers=config.proxy_headers_to_send or None
-            )
-            
-            # Make request
-            # The extension merges proxy CONNECT headers into response.headers
-            response = manager.request('GET', config.test_url)
-            
-            # Check for proxy header in merged response headers
-            header_value = self._check_header(dict(response.headers), config.proxy_header)
-            
-            if header_value:
-                return TestResult(
-                    module_name=self.name,
-                    success=True,
-                    header_value=header_value,
-                    response_status=response.status
-                )
-            else:
-                return TestResult(
-                    module_name=self.name,
-                    success=False,
-                    error=f"Header '{config.proxy_header}' not found in response",
-                    response_status=response.status
-                )
-                
-        except ImportError as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"Import error: {e}"
-            )
-        except Exception as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"{type(e).__name__}: {e}"
-            )
+        from python_proxy_headers.urllib3_proxy_manager import proxy_from_url
+        
+        # Create proxy manager (ProxyHeaderManager) with optional proxy headers
+        manager = proxy_from_url(
+            config.proxy_url,
+            proxy_headers=config.proxy_headers_to_send or None
+        )
+        
+        # Make request
+        # The extension merges proxy CONNECT headers into response.headers
+        response = manager.request('GET', config.test_url)
+        
+        # Check for proxy header in merged response headers
+        header_value = response.headers.get(config.proxy_header)
+        
+        return self._make_result(config, header_value, response.status)
 
 
 # =============================================================================
@@ -226,119 +253,96 @@ class Urllib3Test(ModuleTest):
 class RequestsTest(ModuleTest):
     """Test for requests extension."""
     
+    __slots__ = ()
+    
     name = "requests"
+    extension = "python_proxy_headers.requests_adapter"
     
+    @_wrap_errors
     def test(self, config: TestConfig) -> TestResult:
-        try:
-            from python_proxy_headers.requests_adapter import ProxySession
+        from python_proxy_headers.requests_adapter import ProxySession
+        
+        # Create session with optional proxy headers to send
+        with ProxySession(proxy_headers=config.proxy_headers_to_send or None) as session:
+            session.proxies = {
+                'http': config.proxy_url,
+                'https': config.proxy_url
+            }
             
-            # Create session with optional proxy headers to send
-            with ProxySession(proxy_headers=config.proxy_headers_to_send or None) as session:
-                session.proxies = {
-                    'http': config.proxy_url,
-                    'https': config.proxy_url
-                }
-                
-                # Make request
-                response = session.get(config.test_url)
-                
-                # Check for proxy header in response
-                header_value = self._check_header(dict(response.headers), config.proxy_header)
-                
-                if header_value:
-                    return TestResult(
-                        module_name=self.name,
-                        success=True,
-                        header_value=header_value,
-                        response_status=response.status_code
-                    )
-                else:
-                    return TestResult(
-                        module_name=self.name,
-                        success=False,
-                        error=f"Header '{config.proxy_header}' not found in response",
-                        response_status=response.status_code
-                    )
-                    
-        except ImportError as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"Import error: {e}"
-            )
-        except Exception as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"{type(e).__name__}: {e}"
-            )
+            # Make request
+            response = session.get(config.test_url)
+            
+            # Check for proxy header in response
+            header_value = response.headers.get(config.proxy_header)
+            
+            return self._make_result(config, header_value, response.status_code)
 
 
 # =============================================================================
 # aiohttp Test
 # =============================================================================
 
+# Event loop shared by aiohttp test runs, created on first use
+_LOOP = None
+# Guards creation of _LOOP and serializes runs on it (a loop can't be
+# driven from two threads at once)
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_loop():
+    """Get the shared event loop, creating it (and its atexit close) if needed."""
+    global _LOOP
+    if _LOOP is None:
+        import asyncio
+        _LOOP = asyncio.new_event_loop()
+        atexit.register(_close_loop)
+    return _LOOP
+
+
+def _close_loop() -> None:
+    """Close the shared event loop, unless a test interrupted by Ctrl-C is still running it."""
+    if _LOOP is not None and not _LOOP.is_running():
+        _LOOP.close()
+
+
 class AiohttpTest(ModuleTest):
     """Test for aiohttp extension."""
     
+    __slots__ = ()
+    
     name = "aiohttp"
+    extension = "python_proxy_headers.aiohttp_proxy"
     
+    @_wrap_errors
     def test(self, config: TestConfig) -> TestResult:
-        try:
-            import asyncio
-            from python_proxy_headers.aiohttp_proxy import ProxyClientSession
-            from multidict import CIMultiDict
-            
-            async def _test_async():
-                # ProxyClientSession automatically includes ProxyTCPConnector
-                # and merges proxy headers into response.headers
-                async with ProxyClientSession() as session:
-                    # Build proxy_headers for aiohttp if configured
-                    proxy_headers = None
-                    if config.proxy_headers_to_send:
-                        proxy_headers = CIMultiDict(config.proxy_headers_to_send)
-                    
-                    async with session.get(
-                        config.test_url,
-                        proxy=config.proxy_url,
-                        proxy_headers=proxy_headers
-                    ) as response:
-                        # The extension merges proxy headers into response.headers
-                        header_value = self._check_header(dict(response.headers), config.proxy_header)
-                        status = response.status
-                        
-                        return header_value, status
-            
-            # Run async test
-            header_value, status = asyncio.run(_test_async())
-            
-            if header_value:
-                return TestResult(
-                    module_name=self.name,
-                    success=True,
-                    header_value=header_value,
-                    response_status=status
-                )
-            else:
-                return TestResult(
-                    module_name=self.name,
-                    success=False,
-                    error=f"Header '{config.proxy_header}' not found in response",
-                    response_status=status
-                )
+        from python_proxy_headers.aiohttp_proxy import ProxyClientSession
+        from multidict import CIMultiDict
+        
+        async def _test_async():
+            # ProxyClientSession automatically includes ProxyTCPConnector
+            # and merges proxy headers into response.headers
+            async with ProxyClientSession() as session:
+                # Build proxy_headers for aiohttp if configured
+                proxy_headers = None
+                if config.proxy_headers_to_send:
+                    proxy_headers = CIMultiDict(config.proxy_headers_to_send)
                 
-        except ImportError as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"Import error: {e}"
-            )
-        except Exception as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"{type(e).__name__}: {e}"
-            )
+                async with session.get(
+                    config.test_url,
+                    proxy=config.proxy_url,
+                    proxy_headers=proxy_headers
+                ) as response:
+                    # The extension merges proxy headers into response.headers
+                    header_value = response.headers.get(config.proxy_header)
+                    status = response.status
+                    
+                    return header_value, status
+        
+        # Run async test on the shared loop
+        with _LOOP_LOCK:
+            header_value, status = _get_loop().run_until_complete(_test_async())
+        
+        return self._make_result(config, header_value, status)
 
 
 # =============================================================================
@@ -348,57 +352,34 @@ class AiohttpTest(ModuleTest):
 class HttpxTest(ModuleTest):
     """Test for httpx extension."""
     
+    __slots__ = ()
+    
     name = "httpx"
+    extension = "python_proxy_headers.httpx_proxy"
     
+    @_wrap_errors
     def test(self, config: TestConfig) -> TestResult:
-        try:
-            from python_proxy_headers.httpx_proxy import HTTPProxyTransport
-            import httpx
-            
-            # Build proxy with optional headers
-            proxy_headers_to_send = config.proxy_headers_to_send
-            if proxy_headers_to_send:
-                proxy = httpx.Proxy(url=config.proxy_url, headers=proxy_headers_to_send)
-            else:
-                proxy = config.proxy_url
+        from python_proxy_headers.httpx_proxy import HTTPProxyTransport
+        import httpx
+        
+        # Build proxy with optional headers
+        proxy_headers_to_send = config.proxy_headers_to_send
+        if proxy_headers_to_send:
+            proxy = httpx.Proxy(url=config.proxy_url, headers=proxy_headers_to_send)
+        else:
+            proxy = config.proxy_url
+        
+        # Create transport with proxy (including headers if configured)
+        transport = HTTPProxyTransport(proxy=proxy)
+        
+        # Create client with custom transport mounted for both http and https
+        with httpx.Client(mounts={'http://': transport, 'https://': transport}) as client:
+            response = client.get(config.test_url)
             
-            # Create transport with proxy (including headers if configured)
-            transport = HTTPProxyTransport(proxy=proxy)
+            # The extension merges proxy CONNECT headers into response.headers
+            header_value = response.headers.get(config.proxy_header)
             
-            # Create client with custom transport mounted for both http and https
-            with httpx.Client(mounts={'http://': transport, 'https://': transport}) as client:
-                response = client.get(config.test_url)
-                
-                # The extension merges proxy CONNECT headers into response.headers
-                header_value = self._check_header(dict(response.headers), config.proxy_header)
-                
-                if header_value:
-                    return TestResult(
-                        module_name=self.name,
-                        success=True,
-                        header_value=header_value,
-                        response_status=response.status_code
-                    )
-                else:
-                    return TestResult(
-                        module_name=self.name,
-                        success=False,
-                        error=f"Header '{config.proxy_header}' not found in response",
-                        response_status=response.status_code
-                    )
-                    
-        except ImportError as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"Import error: {e}"
-            )
-        except Exception as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"{type(e).__name__}: {e}"
-            )
+            return self._make_result(config, header_value, response.status_code)
 
 
 # =============================================================================
@@ -408,51 +389,29 @@ class HttpxTest(ModuleTest):
 class PycurlTest(ModuleTest):
     """Test for pycurl extension."""
     
+    __slots__ = ()
+    
     name = "pycurl"
+    extension = "python_proxy_headers.pycurl_proxy"
     
+    @_wrap_errors
     def test(self, config: TestConfig) -> TestResult:
-        try:
-            from python_proxy_headers.pycurl_proxy import get
-            
-            # Make request using high-level API
-            response = get(
-                config.test_url,
-                proxy=config.proxy_url,
-                proxy_headers=config.proxy_headers_to_send or None
-            )
-            
-            # Check for proxy header in response headers or proxy_headers
-            header_value = self._check_header(response.headers, config.proxy_header)
-            if not header_value:
-                header_value = self._check_header(response.proxy_headers, config.proxy_header)
-            
-            if header_value:
-                return TestResult(
-                    module_name=self.name,
-                    success=True,
-                    header_value=header_value,
-                    response_status=response.status_code
-                )
-            else:
-                return TestResult(
-                    module_name=self.name,
-                    success=False,
-                    error=f"Header '{config.proxy_header}' not found in response",
-                    response_status=response.status_code
-                )
-                    
-        except ImportError as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"Import error: {e}"
-            )
-        except Exception as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"{type(e).__name__}: {e}"
-            )
+        from python_proxy_headers.pycurl_proxy import get
+        
+        # Make request using high-level API
+        response = get(
+            config.test_url,
+            proxy=config.proxy_url,
+            proxy_headers=config.proxy_headers_to_send or None
+        )
+        
+        # Check for proxy header in response headers or proxy_headers,
+        # through one lowercased dict (origin headers take precedence)
+        lower_headers = {key.lower(): value for key, value in response.proxy_headers.items()}
+        lower_headers.update((key.lower(), value) for key, value in response.headers.items())
+        header_value = lower_headers.get(config.proxy_header.lower())
+        
+        return self._make_result(config, header_value, response.status_code)
 
 
 # =============================================================================
@@ -462,52 +421,29 @@ class PycurlTest(ModuleTest):
 class CloudscraperTest(ModuleTest):
     """Test for cloudscraper extension."""
     
+    __slots__ = ()
+    
     name = "cloudscraper"
+    extension = "python_proxy_headers.cloudscraper_proxy"
     
+    @_wrap_errors
     def test(self, config: TestConfig) -> TestResult:
-        try:
-            from python_proxy_headers.cloudscraper_proxy import create_scraper
-            
-            # Create scraper with optional proxy headers to send
-            scraper = create_scraper(proxy_headers=config.proxy_headers_to_send or None)
-            scraper.proxies = {
-                'http': config.proxy_url,
-                'https': config.proxy_url
-            }
-            
-            # Make request
-            response = scraper.get(config.test_url)
-            
-            # Check for proxy header in response
-            header_value = self._check_header(dict(response.headers), config.proxy_header)
-            
-            if header_value:
-                return TestResult(
-                    module_name=self.name,
-                    success=True,
-                    header_value=header_value,
-                    response_status=response.status_code
-                )
-            else:
-                return TestResult(
-                    module_name=self.name,
-                    success=False,
-                    error=f"Header '{config.proxy_header}' not found in response",
-                    response_status=response.status_code
-                )
-                    
-        except ImportError as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"Import error: {e}"
-            )
-        except Exception as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"{type(e).__name__}: {e}"
-            )
+        from python_proxy_headers.cloudscraper_proxy import create_scraper
+        
+        # Create scraper with optional proxy headers to send
+        scraper = create_scraper(proxy_headers=config.proxy_headers_to_send or None)
+        scraper.proxies = {
+            'http': config.proxy_url,
+            'https': config.proxy_url
+        }
+        
+        # Make request
+        response = scraper.get(config.test_url)
+        
+        # Check for proxy header in response
+        header_value = response.headers.get(config.proxy_header)
+        
+        return self._make_result(config, header_value, response.status_code)
 
 
 # =============================================================================
@@ -517,59 +453,36 @@ class CloudscraperTest(ModuleTest):
 class AutoscraperTest(ModuleTest):
     """Test for autoscraper extension."""
     
+    __slots__ = ()
+    
     name = "autoscraper"
+    extension = "python_proxy_headers.autoscraper_proxy"
     
+    @_wrap_errors
     def test(self, config: TestConfig) -> TestResult:
-        try:
-            from python_proxy_headers.autoscraper_proxy import ProxyAutoScraper
-            
-            # Create scraper with optional proxy headers to send
-            scraper = ProxyAutoScraper(proxy_headers=config.proxy_headers_to_send or None)
-            
-            # Access the underlying ProxySession to test proxy headers
-            # (AutoScraper itself doesn't expose response headers)
-            session = scraper._get_session()
-            session.proxies = {
-                'http': config.proxy_url,
-                'https': config.proxy_url
-            }
-            
-            # Make request using the session directly
-            response = session.get(config.test_url)
-            
-            # Check for proxy header in response
-            header_value = self._check_header(dict(response.headers), config.proxy_header)
-            
-            # Clean up
-            scraper.close()
-            
-            if header_value:
-                return TestResult(
-                    module_name=self.name,
-                    success=True,
-                    header_value=header_value,
-                    response_status=response.status_code
-                )
-            else:
-                return TestResult(
-                    module_name=self.name,
-                    success=False,
-                    error=f"Header '{config.proxy_header}' not found in response",
-                    response_status=response.status_code
-                )
-                    
-        except ImportError as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"Import error: {e}"
-            )
-        except Exception as e:
-            return TestResult(
-                module_name=self.name,
-                success=False,
-                error=f"{type(e).__name__}: {e}"
-            )
+        from python_proxy_headers.autoscraper_proxy import ProxyAutoScraper
+        
+        # Create scraper with optional proxy headers to send
+        scraper = ProxyAutoScraper(proxy_headers=config.proxy_headers_to_send or None)
+        
+        # Access the underlying ProxySession to test proxy headers
+        # (AutoScraper itself doesn't expose response headers)
+        session = scraper._get_session()
+        session.proxies = {
+            'http': config.proxy_url,
+            'https': config.proxy_url
+        }
+        
+        # Make request using the session directly
+        response = session.get(config.test_url)
+        
+        # Check for proxy header in response
+        header_value = response.headers.get(config.proxy_header)
+        
+        # Clean up
+        scraper.close()
+        
+        return self._make_result(config, header_value, response.status_code)
 
 
 # =============================================================================
@@ -587,25 +500,37 @@ AVAILABLE_TESTS: Dict[str, Type[ModuleTest]] = {
     'autoscraper': AutoscraperTest,
 }
 
+# Test names, computed once for iteration and display
+_TEST_NAMES: Tuple[str, ...] = tuple(AVAILABLE_TESTS)
+_TEST_NAMES_JOINED = ", ".join(_TEST_NAMES)
+
+# One shared instance per test, created on first use (tests hold no state)
+_TEST_INSTANCES: Dict[str, ModuleTest] = {}
+
 
 def get_test(name: str) -> Optional[ModuleTest]:
     """Get a test instance by name."""
-    test_class = AVAILABLE_TESTS.get(name.lower())
+    name = name.lower()
+    test = _TEST_INSTANCES.get(name)
+    if test is not None:
+        return test
+    test_class = AVAILABLE_TESTS.get(name)
     if test_class:
-        return test_class()
+        # setdefault so concurrent first calls still share one instance
+        return _TEST_INSTANCES.setdefault(name, test_class())
     return None
 
 
 def list_available_tests() -> List[str]:
     """List all available test names."""
-    return list(AVAILABLE_TESTS.keys())
+    return list(_TEST_NAMES)
 
 
 # =============================================================================
 # Main Runner
 # =============================================================================
 
-def run_tests(test_names: Optional[List[str]] = None, config: Optional[TestConfig] = None) -> List[TestResult]:
+def run_tests(test_names: Optional[Sequence[str]] = None, config: Optional[TestConfig] = None) -> List[TestResult]:
     """
     Run tests for specified modules.
     
@@ -620,46 +545,77 @@ def run_tests(test_names: Optional[List[str]] = None, config: Optional[TestConfi
         config = TestConfig.from_env()
     
     if test_names is None or len(test_names) == 0:
-        test_names = list_available_tests()
-    
-    results = []
-    
-    print(f"\n{'='*60}")
-    print("Python Proxy Headers - Test Harness")
-    print(f"{'='*60}")
-    print(f"Proxy URL:       {_mask_password(config.proxy_url)}")
-    print(f"Test URL:        {config.test_url}")
-    print(f"Check Header:    {config.proxy_header}")
+        test_names = _TEST_NAMES
+    
+    banner = [
+        _SEP_LINE,
+        "Python Proxy Headers - Test Harness",
+        _SEP,
+        f"Proxy URL:       {_mask_password(config.proxy_url)}",
+        f"Test URL:        {config.test_url}",
+        f"Check Header:    {config.proxy_header}",
+    ]
     if config.send_proxy_header:
-        print(f"Send Header:     {config.send_proxy_header}: {config.send_proxy_value}")
-    print(f"Modules:         {', '.join(test_names)}")
-    print(f"{'='*60}\n")
-    
+        banner.append(f"Send Header:     {config.send_proxy_header}: {config.send_proxy_value}")
+    banner.append(f"Modules:         {', '.join(test_names)}")
+    banner.append(f"{_SEP}\n")
+    print("\n".join(banner))
+    
+    # Import the extensions (and so their backends) one at a time before
+    # starting any threads: first imports of a shared dependency such as
+    # urllib3 from several threads at once can deadlock. Failures are left
+    # for the test itself to report.
     for name in test_names:
+        test = get_test(name)
+        if test is not None and test.extension:
+            try:
+                __import__(test.extension)
+            except Exception:
+                pass
+    
+    print_lock = threading.Lock()
+    # Filled in by index, so results keep the order the modules were given
+    results: List[Optional[TestResult]] = [None] * len(test_names)
+    
+    def _run(index: int, name: str) -> None:
         test = get_test(name)
         if test is None:
-            result = TestResult(
+            results[index] = TestResult(
                 module_name=name,
                 success=False,
-                error=f"Unknown module. Available: {', '.join(list_available_tests())}"
+                error=f"Unknown module. Available: {_TEST_NAMES_JOINED}"
             )
-        else:
-            print(f"Testing {name}...", end=" ", flush=True)
-            result = test.test(config)
-            print("OK" if result.success else "FAILED")
-        
-        results.append(result)
-    
+            return
+        result = test.test(config)
+        # One print per test so lines from concurrent tests don't interleave
+        with print_lock:
+            print(f"Testing {name}... {'OK' if result.success else 'FAILED'}", flush=True)
+        results[index] = result
+    
+    # Tests are network-bound, so run them concurrently. The threads are
+    # daemons so Ctrl-C can exit without waiting on tests blocked in a
+    # request (a thread pool would be joined at interpreter exit).
+    threads = [
+        threading.Thread(target=_run, args=(index, name), daemon=True)
+        for index, name in enumerate(test_names)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
     return results
 
 
 def _mask_password(url: str) -> str:
     """Mask password in URL for display."""
+    from urllib.parse import urlparse
+    
     parsed = urlparse(url)
-    if parsed.password:
-        masked = url.replace(f":{parsed.password}@", ":****@")
-        return masked
-    return url
+    if not parsed.password:
+        return url
+    # Only touch the netloc, so a matching string elsewhere in the URL is kept
+    netloc = parsed.netloc.replace(f":{parsed.password}@", ":****@", 1)
+    return parsed._replace(netloc=netloc).geturl()
 
 
 def print_results(results: List[TestResult], verbose: bool = False) -> bool:
@@ -673,60 +629,54 @@ def print_results(results: List[TestResult], verbose: bool = False) -> bool:
     Returns:
         True if all tests passed, False otherwise
     """
-    print(f"\n{'='*60}")
-    print("Results")
-    print(f"{'='*60}")
+    lines = [_SEP_LINE, "Results", _SEP]
     
     passed = 0
     failed = 0
     
     for result in results:
-        print(result.format(verbose=verbose))
+        lines.append(result.format(verbose=verbose))
         if result.success:
             passed += 1
         else:
             failed += 1
     
-    print(f"{'='*60}")
-    print(f"Passed: {passed}/{len(results)}")
+    lines.append(_SEP)
+    lines.append(f"Passed: {passed}/{len(results)}")
     
     if failed > 0:
-        print(f"Failed: {failed}/{len(results)}")
-        return False
+        lines.append(f"Failed: {failed}/{len(results)}")
+    else:
+        lines.append("All tests passed!")
     
-    print("All tests passed!")
-    return True
+    # Write the summary in one go rather than a print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
+    return failed == 0
 
 
 def main():
     """Main entry point."""
     # Parse command line arguments
-    args = sys.argv[1:] if len(sys.argv) > 1 else []
-    
-    # Check for verbose flag
-    verbose = False
-    if '-v' in args:
-        verbose = True
-        args.remove('-v')
-    if '--verbose' in args:
-        verbose = True
-        args.remove('--verbose')
+    args = sys.argv[1:]
+    arg_set = set(args)
     
     # Handle --help
-    if '--help' in args or '-h' in args:
+    if arg_set & {'-h', '--help'}:
         print(__doc__)
-        print(f"\nAvailable modules: {', '.join(list_available_tests())}")
+        print(f"\nAvailable modules: {_TEST_NAMES_JOINED}")
         sys.exit(0)
     
     # Handle --list
-    if '--list' in args or '-l' in args:
-        print("Available modules:")
-        for name in list_available_tests():
-            print(f"  - {name}")
+    if arg_set & {'-l', '--list'}:
+        sys.stdout.write("Available modules:\n" + "".join(f"  - {name}\n" for name in _TEST_NAMES))
         sys.exit(0)
     
+    # Check for verbose flag
+    verbose_flags = {'-v', '--verbose'}
+    verbose = bool(arg_set & verbose_flags)
+    
     # Remaining args are module names
-    test_names = args if args else None
+    test_names = [arg for arg in args if arg not in verbose_flags] or None
     
     try:
         config = TestConfig.from_env()
@@ -746,6 +696,7 @@ def main():
         print("\nInterrupted.")
         sys.exit(130)
     except Exception as e:
+        import traceback
         print(f"\nUnexpected error: {e}", file=sys.stderr)
         traceback.print_exc()
         sys.exit(1)